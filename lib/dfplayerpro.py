@@ -1,17 +1,55 @@
 from micropython import const
 from machine import Pin, UART
-from time import sleep_ms
+from time import sleep_ms, ticks_ms, ticks_add, ticks_diff
 
 
 class DFPlayerPro:
     """
     MicroPython class for communication with the DFRobot DFPlayer Pro over UART.
+
+    Set DEBUG to True to print requests and responses (keep it False for benchmarks and production).
+
+    The zero-argument commands amplifier_on, amplifier_off, prompt_on, prompt_off, led_on, led_off,
+    play_pause and record_and_pause are generated at import time; each returns the response as bytes.
     """
 
+    DEBUG = False
     DELAY_SEND_COMMAND = const(100)
     DELAY_TEST_CONNECTION = const(500)
-
-    def __init__(self, tx_pin: int, rx_pin: int, baudrate: int = 115200, uart_id: int = 1):
+    DELAY_POLL = const(2)
+
+    _VALID_BAUDRATES = {9600, 19200, 38400, 57600, 115200}
+
+    _PROBE = b"AT\r\n"
+    _CMD_QUERY_VOLUME = b"AT+VOL=?\r\n"
+    _CMD_QUERY_PLAY_MODE = b"AT+PLAYMODE=?\r\n"
+    _CMD_QUERY_FILE_NUMBER = b"AT+QUERY=1\r\n"
+    _CMD_QUERY_FILE_COUNT = b"AT+QUERY=2\r\n"
+    _CMD_QUERY_PLAYED_TIME = b"AT+QUERY=3\r\n"
+    _CMD_QUERY_TOTAL_TIME = b"AT+QUERY=4\r\n"
+    _CMD_QUERY_FILE_NAME = b"AT+QUERY=5\r\n"
+    _CMD_PLAY_NEXT = b"AT+PLAY=NEXT\r\n"
+    _CMD_PLAY_LAST = b"AT+PLAY=LAST\r\n"
+    _CMD_DELETE = b"AT+DEL\r\n"
+    _CMD_RECORD_SAVE = b"AT+REC=SAVE\r\n"
+
+    # Zero-argument commands without side effects on the query cache, bound as methods below the class
+    # and deleted afterwards.
+    # Each of them answers with "OK\r\n" on success.
+    _FRAMES = {
+        "amplifier_on": b"AT+AMP=ON\r\n",
+        "amplifier_off": b"AT+AMP=OFF\r\n",
+        "prompt_on": b"AT+PROMPT=ON\r\n",
+        "prompt_off": b"AT+PROMPT=OFF\r\n",
+        "led_on": b"AT+LED=ON\r\n",
+        "led_off": b"AT+LED=OFF\r\n",
+        "play_pause": b"AT+PLAY=PP\r\n",
+        "record_and_pause": b"AT+REC=RP\r\n",
+    }
+
+    def __init__(self, tx_pin: int, rx_pin: int, baudrate: int = 115200, uart_id: int = 1,
+                 batch: list = None, rxbuf: int = 512, txbuf: int = 256, cache_ttl: int = 0,
+                 timeout: int = 50, timeout_char: int = 2):
         """
         Initialize the UART object.
 
@@ -23,54 +61,169 @@ class DFPlayerPro:
         :type baudrate: int
         :param uart_id: The ID of the UART peripheral to use (default: 1).
         :type uart_id: int
-        """
-        uart = int(uart_id)
-        baud = int(baudrate)
-        tx = int(tx_pin)
-        rx = int(rx_pin)
-
-        self.uart = UART(uart, baudrate=baud, tx=Pin(tx), rx=Pin(rx))
-        self.uart.init(baudrate=baudrate, bits=8, parity=None, stop=1)
-
-    def _send_command(self, command: str) -> str:
+        :param batch: Optional list of commands (without "AT+" prefix) sent in one write after setup (default: None).
+                      The commands are sent as given, without the range checks of set_volume or set_play_mode.
+        :type batch: list
+        :param rxbuf: The size of the UART receive buffer in bytes (default: 512).
+        :type rxbuf: int
+        :param txbuf: The size of the UART transmit buffer in bytes (default: 256).
+        :type txbuf: int
+        :param cache_ttl: Time in milliseconds to cache stable query results, 0 disables caching (default: 0).
+        :type cache_ttl: int
+        :param timeout: The maximum time in milliseconds a UART read waits for the first character (default: 50).
+        :type timeout: int
+        :param timeout_char: The maximum time in milliseconds a UART read waits between characters (default: 2).
+        :type timeout_char: int
+        """
+        self.uart = UART(int(uart_id), baudrate=int(baudrate), tx=Pin(int(tx_pin)), rx=Pin(int(rx_pin)),
+                         bits=8, parity=None, stop=1, rxbuf=rxbuf, txbuf=txbuf,
+                         timeout=timeout, timeout_char=timeout_char)
+        self._cache_ttl = int(cache_ttl)
+        self._cache = {}
+
+        if batch:
+            self._send_commands(batch)
+
+    def _read_until(self, terminator: bytes = b"\r\n", timeout_ms: int = DELAY_SEND_COMMAND, count: int = 1):
+        """
+        Polls the UART until the expected number of terminators is received or the timeout expires.
+
+        :param terminator: The byte sequence that ends a response line (default: b"\\r\\n").
+        :type terminator: bytes
+        :param timeout_ms: The maximum time to wait for the response in milliseconds.
+        :type timeout_ms: int
+        :param count: The number of response lines to wait for (default: 1).
+        :type count: int
+        :return: The received bytes, or None if nothing was received.
+        :rtype: bytes
+        """
+        buf = b""
+        start = ticks_ms()
+
+        while ticks_diff(ticks_ms(), start) < timeout_ms:
+            available = self.uart.any()
+
+            if available:
+                buf += self.uart.read(available) or b""
+
+                if buf.count(terminator) >= count:
+                    break
+            else:
+                sleep_ms(self.DELAY_POLL)
+
+        return buf or None
+
+    def _send_bytes(self, frame: bytes, decode: bool = False, timeout_ms: int = DELAY_SEND_COMMAND):
+        """
+        Sends a complete, pre-encoded command frame to a device and returns the response.
+
+        :param frame: The full command frame including "AT+" prefix and line ending.
+        :type frame: bytes
+        :param decode: Whether to decode the response to a string (default: False).
+        :type decode: bool
+        :param timeout_ms: The maximum time to wait for the response in milliseconds (default: DELAY_SEND_COMMAND).
+        :type timeout_ms: int
+        :return: The response received from the device, as str if decode is set, otherwise as bytes.
+        :rtype: bytes or str
+        """
+        if self.DEBUG:
+            print("[INFO] request:", frame)
+        if self.uart.any():
+            self.uart.read()
+        self.uart.write(frame)
+
+        response = self._read_until(timeout_ms=timeout_ms)
+        if self.DEBUG:
+            print("[INFO] response:", response)
+        return response.decode('ascii') if decode and response else response
+
+    def _send_command(self, command: str, decode: bool = False):
         """
         Sends a command to a device and returns the response.
 
         :param command: The command to send.
         :type command: str
-        :return: The response received from the device.
+        :param decode: Whether to decode the response to a string (default: False).
+        :type decode: bool
+        :return: The response received from the device, as str if decode is set, otherwise as bytes.
+        :rtype: bytes or str
+        """
+        return self._send_bytes(b"AT+" + command.encode() + b"\r\n", decode)
+
+    def _cached_query(self, key: str, frame: bytes) -> str:
+        """
+        Returns a cached query response while it is younger than the cache TTL, otherwise queries the device.
+
+        :param key: The cache key of the query.
+        :type key: str
+        :param frame: The query command frame to send on a cache miss.
+        :type frame: bytes
+        :return: The decoded response of the query.
         :rtype: str
         """
-        full_command = f"AT+{command}\r\n"
+        if not self._cache_ttl:
+            return self._send_bytes(frame, decode=True)
 
-        print(f"[INFO] request: {full_command}")
-        self.uart.write(full_command)
-        sleep_ms(self.DELAY_SEND_COMMAND)
+        entry = self._cache.get(key)
+        if entry is not None:
+            # a remaining time outside (0, ttl] means the entry expired, also after a ticks wrap-around
+            if 0 < ticks_diff(entry[0], ticks_ms()) <= self._cache_ttl:
+                return entry[1]
+            del self._cache[key]
 
-        response = self.uart.read()
-        print(f"[INFO] response: {response}")
-        return response.decode('utf-8') if response else None
+        response = self._send_bytes(frame, decode=True)
+        if response is not None:
+            # only cache query answers, not acknowledgements or errors
+            reply = response.strip().upper()
+            if reply != "OK" and not reply.startswith("ERROR"):
+                self._cache[key] = (ticks_add(ticks_ms(), self._cache_ttl), response)
+        return response
 
-    def test_connection(self):
+    def _send_commands(self, commands: list) -> list:
         """
-        Test the connection by sending an AT command via UART.
+        Sends several commands to a device in a single write and returns the responses.
+
+        :param commands: The commands to send (without "AT+" prefix), e.g. ["VOL=15", "PLAY=NEXT"].
+        :type commands: list
+        :return: The response lines received from the device.
+        :rtype: list
+        """
+        payload = b"".join(b"AT+" + command.encode() + b"\r\n" for command in commands)
+        self._cache.clear()
+
+        if self.DEBUG:
+            print("[INFO] request:", payload)
+        if self.uart.any():
+            self.uart.read()
+        self.uart.write(payload)
+
+        response = self._read_until(timeout_ms=self.DELAY_SEND_COMMAND * len(commands), count=len(commands))
+        if self.DEBUG:
+            print("[INFO] response:", response)
+        if not response:
+            return []
 
-        :return: The response received from the device as a decoded string, or None if no response was received.
+        if response.endswith(b"\r\n"):
+            response = response[:-2]
+        return response.split(b"\r\n")
+
+    def test_connection(self, decode: bool = False):
         """
-        self.uart.write("AT\r\n")
-        sleep_ms(self.DELAY_TEST_CONNECTION)
+        Test the connection by sending an AT command via UART.
 
-        response = self.uart.read()
-        print(f"[INFO] response: {response}")
-        return response.decode('utf-8') if response else None
+        :param decode: Whether to decode the response to a string (default: False).
+        :type decode: bool
+        :return: The response received from the device (decoded if requested), or None if no response was received.
+        """
+        return self._send_bytes(self._PROBE, decode, timeout_ms=self.DELAY_TEST_CONNECTION)
 
-    def set_volume(self, volume: int) -> str:
+    def set_volume(self, volume: int) -> bytes:
         """
         Set the volume of the device.
 
         :param volume: The volume level to set.
-        :return: The response from sending the volume command.
-        :rtype: str
+        :return: The response from sending the volume command ("OK" on success).
+        :rtype: bytes
         :raises ValueError: If the volume is not between 0 and 30.
         """
         if volume < 0 or volume > 30:
@@ -78,7 +231,7 @@ class DFPlayerPro:
 
         return self._send_command(f"VOL={volume}")
 
-    def set_play_mode(self, mode: int) -> str:
+    def set_play_mode(self, mode: int) -> bytes:
         """
         Set the play mode of the media player.
             1: repeat one song
@@ -88,24 +241,25 @@ class DFPlayerPro:
             5: Repeat all in the folder
 
         :param mode: The play mode to set. Valid values are: 1, 2, 3, 4, and 5.
-        :return: The response message from the media player.
-        :rtype: str
+        :return: The response message from the media player ("OK" on success).
+        :rtype: bytes
         :raises: ValueError: If the provided play mode is invalid.
         """
-        if int(mode) not in [1, 2, 3, 4, 5]:
+        if not 1 <= mode <= 5:
             raise ValueError("[ERROR] Invalid play mode")
 
+        self._cache.pop("mode", None)
         return self._send_command(f"PLAYMODE={mode}")
 
-    def set_baudrate(self, baudrate: int) -> str:
+    def set_baudrate(self, baudrate: int) -> bytes:
         """
         Set UART baudrate
 
         :param baudrate: The baud rate to be set. Valid values are: 9600, 19200, 38400, 57600, 115200.
-        :return: A string indicating the success of the operation.
+        :return: The response indicating the success of the operation ("OK" on success).
         :raises ValueError: If the provided baud rate is invalid.
         """
-        if int(baudrate) not in [9600, 19200, 38400, 57600, 115200]:
+        if baudrate not in self._VALID_BAUDRATES:
             raise ValueError("[ERROR] Invalid baudrate")
 
         return self._send_command(f"BAUDRATE={baudrate}")
@@ -117,16 +271,17 @@ class DFPlayerPro:
         :return: The volume level as a string.
         :rtype: str
         """
-        return self._send_command("VOL=?")
+        return self._send_bytes(self._CMD_QUERY_VOLUME, decode=True)
 
     def query_play_mode(self) -> str:
         """
         Query the play mode of the device.
+        The result may come from the cache when cache_ttl is set.
 
         :return: The current play mode of the device.
         :rtype: str
         """
-        return self._send_command("PLAYMODE=?")
+        return self._cached_query("mode", self._CMD_QUERY_PLAY_MODE)
 
     def query_playing_file_number(self) -> str:
         """
@@ -135,16 +290,17 @@ class DFPlayerPro:
         :return: The playing file number.
         :rtype: str
         """
-        return self._send_command("QUERY=1")
+        return self._send_bytes(self._CMD_QUERY_FILE_NUMBER, decode=True)
 
     def query_total_file_count(self) -> str:
         """
         Query the total file count.
+        The result may come from the cache when cache_ttl is set.
 
         :return: The total file count as a string.
         :rtype: str
         """
-        return self._send_command("QUERY=2")
+        return self._cached_query("count", self._CMD_QUERY_FILE_COUNT)
 
     def query_played_time(self) -> str:
         """
@@ -153,16 +309,17 @@ class DFPlayerPro:
         :return: The played time as a string.
         :rtype: str
         """
-        return self._send_command("QUERY=3")
+        return self._send_bytes(self._CMD_QUERY_PLAYED_TIME, decode=True)
 
     def query_total_time(self) -> str:
         """
         Queries and returns the total time.
+        The result may come from the cache when cache_ttl is set.
 
         :return: The total time as a string.
         :rtype: str
         """
-        return self._send_command("QUERY=4")
+        return self._cached_query("time", self._CMD_QUERY_TOTAL_TIME)
 
     def query_playing_file_name(self) -> str:
         """
@@ -171,177 +328,122 @@ class DFPlayerPro:
         :return: The name of the currently playing file as a string.
         :rtype: str
         """
-        return self._send_command("QUERY=5")
-
-    def amplifier_on(self) -> str:
-        """
-        Turns on the amplifier.
-
-        :return: The response from sending the "AMP=ON" command.
-        :rtype: str
-        """
-        return self._send_command("AMP=ON")
-
-    def amplifier_off(self) -> str:
-        """
-        Turns off the amplifier.
-
-        :return: The response from sending the "AMP=OFF" command.
-        :rtype: str
-        """
-        return self._send_command("AMP=OFF")
-
-    def prompt_on(self) -> str:
-        """
-        Enable prompt on the device.
-
-        :return: The response from sending the command "PROMPT=ON".
-        :rtype: str
-        """
-        return self._send_command("PROMPT=ON")
-
-    def prompt_off(self) -> str:
-        """
-        Turn off the prompt functionality.
-
-        :return: The response from executing the command "PROMPT=OFF".
-        :rtype: str
-        """
-        return self._send_command("PROMPT=OFF")
+        return self._send_bytes(self._CMD_QUERY_FILE_NAME, decode=True)
 
-    def led_on(self) -> str:
-        """
-        Turns on the LED.
-
-        :return: The response from executing the command "LED=ON".
-        :rtype: str
-        """
-        return self._send_command("LED=ON")
-
-    def led_off(self) -> str:
-        """
-        Turns off the LED.
-
-        :return: The response from executing the command "LED=OFF".
-        :rtype: str
-        """
-        return self._send_command("LED=OFF")
-
-    def play_next(self) -> str:
+    def play_next(self) -> bytes:
         """
         Plays the next track in the playlist.
 
-        :return: The response from the "PLAY=NEXT" command.
-        :rtype: str
+        :return: The response from the "PLAY=NEXT" command ("OK" on success).
+        :rtype: bytes
         """
-        return self._send_command("PLAY=NEXT")
+        self._cache.pop("time", None)
+        return self._send_bytes(self._CMD_PLAY_NEXT)
 
-    def play_last(self) -> str:
+    def play_last(self) -> bytes:
         """
         Plays the previous track in the playlist.
 
-        :return: The response from the "PLAY=LAST" command.
-        :rtype: str
-        """
-        return self._send_command("PLAY=LAST")
-
-    def play_pause(self) -> str:
-        """
-        Play or pause the playback.
-
-        :return: The result of the "PLAY=PP" command.
-        :rtype: str
+        :return: The response from the "PLAY=LAST" command ("OK" on success).
+        :rtype: bytes
         """
-        return self._send_command("PLAY=PP")
+        self._cache.pop("time", None)
+        return self._send_bytes(self._CMD_PLAY_LAST)
 
-    def fast_rewind(self, seconds: int) -> str:
+    def fast_rewind(self, seconds: int) -> bytes:
         """
         Fast Rewind the playback by a specified number of seconds.
 
         :param seconds: The number of seconds to rewind the media.
         :type seconds: int
-        :return: The result of the "TIME=-{seconds}" command.
-        :rtype: str
+        :return: The result of the "TIME=-{seconds}" command ("OK" on success).
+        :rtype: bytes
         """
-        sec = int(seconds)
+        return self._send_command(f"TIME=-{seconds}")
 
-        return self._send_command(f"TIME=-{sec}")
-
-    def fast_forward(self, seconds: int) -> str:
+    def fast_forward(self, seconds: int) -> bytes:
         """
         Fast forwards the playback by the specified number of seconds.
 
         :param seconds: The number of seconds to forward the media.
         :type seconds: int
-        :return: The result of the "TIME=+{seconds}" command.
-        :rtype: str
+        :return: The result of the "TIME=+{seconds}" command ("OK" on success).
+        :rtype: bytes
         """
-        sec = int(seconds)
+        return self._send_command(f"TIME=+{seconds}")
 
-        return self._send_command(f"TIME=+{sec}")
-
-    def start_from_second(self, second: int) -> str:
+    def start_from_second(self, second: int) -> bytes:
         """
         Starts the playback by a specified number of seconds.
 
         :param second: The second to start from as an integer.
         :type second: int
-        :return: The result of the "TIME={second}" command.
-        :rtype: str
+        :return: The result of the "TIME={second}" command ("OK" on success).
+        :rtype: bytes
         """
-        sec = int(second)
-
-        return self._send_command(f"TIME={sec}")
+        return self._send_command(f"TIME={second}")
 
-    def play_file_by_number(self, number: int) -> str:
+    def play_file_by_number(self, number: int) -> bytes:
         """
         Play a file by its number.
 
         :param number: The number of the file to be played.
         :type number: int
-        :return: The result of the "PLAYNUM={number}" command.
-        :rtype: str
+        :return: The result of the "PLAYNUM={number}" command ("OK" on success).
+        :rtype: bytes
         """
-        num = int(number)
-
-        return self._send_command(f"PLAYNUM={num}")
+        self._cache.pop("time", None)
+        return self._send_command(f"PLAYNUM={number}")
 
-    def play_file_by_path(self, path: str) -> str:
+    def play_file_by_path(self, path: str) -> bytes:
         """
         Plays a file by the given file path.
 
         :param path: The file path of the file to play.
         :type path: str
-        :return: The result of the "PLAYFILE={path}" command.
-        :rtype: str
+        :return: The result of the "PLAYFILE={path}" command ("OK" on success).
+        :rtype: bytes
         """
-        file_path = str(path)
-
-        return self._send_command(f"PLAYFILE={file_path}")
+        self._cache.pop("time", None)
+        return self._send_command(f"PLAYFILE={path}")
 
-    def delete_playing_file(self) -> str:
+    def delete_playing_file(self) -> bytes:
         """
         Delete the playing file.
 
-        :return: The response from sending the "DEL" command.
-        :rtype: str
+        :return: The response from sending the "DEL" command ("OK" on success).
+        :rtype: bytes
         """
-        return self._send_command("DEL")
+        self._cache.pop("count", None)
+        self._cache.pop("time", None)
+        return self._send_bytes(self._CMD_DELETE)
 
-    def record_and_pause(self) -> str:
+    def save_recording(self) -> bytes:
         """
-        Records audio and pauses the recording.
+        Saves the recording.
 
-        :return: The response from sending the "REC=RP" command.
-        :rtype: str
+        :return: The response from the "REC=SAVE" method ("OK" on success).
+        :rtype: bytes
         """
-        return self._send_command("REC=RP")
+        self._cache.pop("count", None)
+        return self._send_bytes(self._CMD_RECORD_SAVE)
 
-    def save_recording(self) -> str:
-        """
-        Saves the recording.
 
-        :return: The response from the "REC=SAVE" method.
-        :rtype: str
-        """
-        return self._send_command("REC=SAVE")
+def _bind(frame: bytes):
+    """
+    Creates a zero-argument DFPlayerPro method that sends a fixed command frame.
+
+    :param frame: The full command frame to send.
+    :type frame: bytes
+    :return: The generated method.
+    :rtype: function
+    """
+    def method(self) -> bytes:
+        return self._send_bytes(frame)
+
+    return method
+
+
+for _name, _frame in DFPlayerPro._FRAMES.items():
+    setattr(DFPlayerPro, _name, _bind(_frame))
+del DFPlayerPro._FRAMES, _name, _frame
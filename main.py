@@ -6,12 +6,14 @@ UART_TX_GPIO = const(17)
 UART_RX_GPIO = const(16)
 
 
-if __name__ == '__main__':
+def main():
     dfplayer = DFPlayerPro(tx_pin=UART_TX_GPIO, rx_pin=UART_RX_GPIO)
 
-    response = dfplayer.test_connection()
+    response = dfplayer.test_connection(decode=True)
     print(response)
 
-    dfplayer.set_volume(15)
-    dfplayer.set_play_mode(4)
-    dfplayer.play_next()
+    dfplayer._send_commands(["VOL=15", "PLAYMODE=4", "PLAY=NEXT"])
+
+
+if __name__ == '__main__':
+    main()